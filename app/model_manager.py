@@ -132,14 +132,15 @@ class ModelFileManager:
                 try:
                     full_path = os.path.join(dirpath, file_name)
                     relative_path = os.path.relpath(full_path, directory)
+                    stats = os.stat(full_path)
 
                     # Get file metadata
                     file_info = {
                         "name": relative_path,
                         "pathIndex": pathIndex,
-                        "modified": os.path.getmtime(full_path),  # Add modification time
-                        "created": os.path.getctime(full_path),   # Add creation time
-                        "size": os.path.getsize(full_path)        # Add file size
+                        "modified": stats.st_mtime,  # Add modification time
+                        "created": stats.st_ctime,   # Add creation time
+                        "size": stats.st_size        # Add file size
                     }
                     result.append(file_info)
 
@@ -24,11 +24,12 @@ class FileInfo(TypedDict):
 
 
 def get_file_info(path: str, relative_to: str) -> FileInfo:
+    stats = os.stat(path)
     return {
         "path": os.path.relpath(path, relative_to).replace(os.sep, '/'),
-        "size": os.path.getsize(path),
-        "modified": os.path.getmtime(path),
-        "created": os.path.getctime(path)
+        "size": stats.st_size,
+        "modified": stats.st_mtime,
+        "created": stats.st_ctime
     }
 
 